@@ -0,0 +1,27 @@
+"""
+Helpers shared by the API routers.
+"""
+
+import asyncio
+
+from fastapi import HTTPException, Request
+
+from core.analyzer import HumanLikenessAnalyzer
+
+
+async def get_analyzer(request: Request) -> HumanLikenessAnalyzer:
+    """
+    Returns the app's analyzer once it has finished loading. The lifespan
+    loads it in the background so the server accepts traffic (and answers
+    /api/health) straight away; requests that arrive earlier wait here.
+    If loading failed, answers 503 — the lifespan has already logged why.
+    """
+    state = request.app.state
+    ready = getattr(state, "analyzer_ready", None)
+    if ready is not None:
+        try:
+            # Shielded: a client that disconnects mid-wait must not cancel the load
+            await asyncio.shield(ready)
+        except Exception:
+            raise HTTPException(status_code=503, detail="Analyzer unavailable. Please try again later.")
+    return state.analyzer
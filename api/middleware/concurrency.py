@@ -0,0 +1,51 @@
+"""
+Admission limit for the CPU-heavy endpoints.
+
+The rate limiter bounds how often one IP may call us; it says nothing about
+how many analyses run at once. A burst of large requests from many IPs would
+otherwise all land in the threadpool together, pinning every core and
+inflating memory. Requests past the cap wait here, before any work starts.
+"""
+
+import os
+import asyncio
+from typing import FrozenSet
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_DEFAULT_PATHS = frozenset({"/api/v1/analyze", "/api/v1/transform"})
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Caps in-flight requests to the given paths at max_concurrent
+    (default 2 × CPU count). A plain counter guarded by an asyncio.Condition
+    rather than a Semaphore, so the cap stays a simple attribute.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrent: int = 0,
+        paths: FrozenSet[str] = _DEFAULT_PATHS,
+    ):
+        self.app = app
+        self._max = max_concurrent or 2 * (os.cpu_count() or 1)
+        self._paths = paths
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self._paths:
+            await self.app(scope, receive, send)
+            return
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._max)
+            self._active += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            async with self._cond:
+                self._active -= 1
+                self._cond.notify(1)
@@ -8,6 +8,12 @@ from pydantic import BaseModel, Field, field_validator
 
 from core.config import settings
 
+# Read once at import — validate_text runs on every request body
+_MIN_LEN = settings.MIN_TEXT_LENGTH
+_MAX_LEN = settings.MAX_TEXT_LENGTH
+_TOO_SHORT = f"Text must be at least {_MIN_LEN} characters."
+_TOO_LONG = f"Text exceeds maximum length of {_MAX_LEN} characters."
+
 
 class TextRequest(BaseModel):
     text: str = Field(..., description="Input text to process.")
@@ -16,10 +22,11 @@ class TextRequest(BaseModel):
     @classmethod
     def validate_text(cls, v: str) -> str:
         v = v.strip()
-        if len(v) < settings.MIN_TEXT_LENGTH:
-            raise ValueError(f"Text must be at least {settings.MIN_TEXT_LENGTH} characters.")
-        if len(v) > settings.MAX_TEXT_LENGTH:
-            raise ValueError(f"Text exceeds maximum length of {settings.MAX_TEXT_LENGTH} characters.")
+        n = len(v)
+        if n < _MIN_LEN:
+            raise ValueError(_TOO_SHORT)
+        if n > _MAX_LEN:
+            raise ValueError(_TOO_LONG)
         return v
 
 
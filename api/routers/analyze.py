@@ -4,7 +4,9 @@
 
 import logging
 from fastapi import APIRouter, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
+from api.dependencies import get_analyzer
 from api.models.schemas import TextRequest, AnalysisResponse
 
 router = APIRouter()
@@ -17,10 +19,11 @@ async def analyze_text(request: Request, body: TextRequest) -> AnalysisResponse:
     Returns a human-likeness score (0–100) and detailed feature breakdown
     for the supplied text. The text is never stored or logged.
     """
-    analyzer = request.app.state.analyzer
+    analyzer = await get_analyzer(request)
 
     try:
-        result = analyzer.score(body.text)
+        # Scoring is pure-Python CPU work; keep it off the event loop
+        result = await run_in_threadpool(analyzer.score, body.text)
     except Exception as exc:
         logger.error("Analyzer error: %s", exc, exc_info=True)
         raise HTTPException(status_code=500, detail="Analysis failed. Please try again.")
@@ -4,8 +4,12 @@ before/after scores so the caller can see what changed.
 """
 
 import logging
+from functools import lru_cache
+
 from fastapi import APIRouter, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
+from api.dependencies import get_analyzer
 from api.models.schemas import TransformRequest, TransformResponse, AnalysisResponse
 from core.transformer import TextTransformer
 
@@ -13,6 +17,30 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_transformer(use_contractions: bool, simplify_formal: bool, vary_sentences: bool) -> TextTransformer:
+    """
+    One shared transformer per option combination (there are only 8).
+    Transformers keep no per-request state; the unseeded RNG they share
+    across requests only picks sentence openers. The rule cache stays off
+    so no user text outlives its request.
+    """
+    return TextTransformer(
+        use_contractions=use_contractions,
+        simplify_formal=simplify_formal,
+        vary_sentences=vary_sentences,
+        cache=False,
+    )
+
+
+def _score_and_transform(analyzer, transformer: TextTransformer, text: str):
+    """Runs the whole CPU-bound pipeline in one go so it costs a single thread hop."""
+    before_result = analyzer.score(text)
+    transformed = transformer.transform(text)
+    after_result = analyzer.score(transformed)
+    return before_result, transformed, after_result
+
+
 def _build_analysis_response(result) -> AnalysisResponse:
     return AnalysisResponse(
         score=result.score,
@@ -31,19 +59,19 @@ async def transform_text(request: Request, body: TransformRequest) -> TransformR
     alongside before/after human-likeness scores. Text is processed in memory
     and never persisted.
     """
-    analyzer = request.app.state.analyzer
+    analyzer = await get_analyzer(request)
     opts = body.options
 
-    transformer = TextTransformer(
-        use_contractions=opts.use_contractions,
-        simplify_formal=opts.simplify_formal,
-        vary_sentences=opts.vary_sentences,
+    transformer = _get_transformer(
+        opts.use_contractions,
+        opts.simplify_formal,
+        opts.vary_sentences,
     )
 
     try:
-        before_result = analyzer.score(body.text)
-        transformed = transformer.transform(body.text)
-        after_result = analyzer.score(transformed)
+        before_result, transformed, after_result = await run_in_threadpool(
+            _score_and_transform, analyzer, transformer, body.text
+        )
     except Exception as exc:
         logger.error("Transform error: %s", exc, exc_info=True)
         raise HTTPException(status_code=500, detail="Transformation failed. Please try again.")
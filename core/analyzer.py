@@ -2,18 +2,18 @@
 HumanLikenessAnalyzer — extracts linguistic features from text and scores
 how closely it resembles human writing versus typical AI output.
 
-Uses only scikit-learn + standard library; no external LLM calls required.
+Uses only the standard library; no external LLM calls required.
 """
 
 import re
-import math
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
-
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +37,7 @@ class TextFeatures:
     hedge_word_rate: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class AnalysisResult:
     score: float                            # 0–100, higher = more human-like
     grade: str                              # A/B/C/D/F label
@@ -48,42 +48,71 @@ class AnalysisResult:
 
 
 # Common English contractions used to detect informal, human-style writing
-_CONTRACTIONS = re.compile(
-    r"\b(i'm|you're|he's|she's|it's|we're|they're|i've|you've|we've|they've|"
-    r"i'd|you'd|he'd|she'd|we'd|they'd|i'll|you'll|he'll|she'll|we'll|they'll|"
-    r"isn't|aren't|wasn't|weren't|haven't|hasn't|hadn't|won't|wouldn't|don't|"
-    r"doesn't|didn't|can't|couldn't|shouldn't|mustn't|let's|that's|who's|what's|"
-    r"here's|there's|when's|where's|why's|how's)\b",
-    re.IGNORECASE,
-)
-
-_PASSIVE_INDICATORS = re.compile(
-    r"\b(was|were|is|are|been|being)\s+([\w]+ed|built|written|made|done|given|"
-    r"taken|known|seen|found|used|called|considered|expected|required|provided)\b",
-    re.IGNORECASE,
-)
+_CONTRACTIONS = frozenset([
+    "i'm","you're","he's","she's","it's","we're","they're","i've","you've","we've","they've",
+    "i'd","you'd","he'd","she'd","we'd","they'd","i'll","you'll","he'll","she'll","we'll","they'll",
+    "isn't","aren't","wasn't","weren't","haven't","hasn't","hadn't","won't","wouldn't","don't",
+    "doesn't","didn't","can't","couldn't","shouldn't","mustn't","let's","that's","who's","what's",
+    "here's","there's","when's","where's","why's","how's",
+])
 
-_HEDGE_WORDS = re.compile(
-    r"\b(perhaps|maybe|possibly|probably|might|could|seems|appear|suggest|"
-    r"indicate|generally|typically|usually|often|sometimes|somewhat|rather|"
-    r"fairly|quite|relatively|apparently|presumably)\b",
-    re.IGNORECASE,
-)
+# Passive voice = auxiliary immediately followed (whitespace only) by a participle
+_PASSIVE_AUXILIARIES = frozenset(["was","were","is","are","been","being"])
+_PASSIVE_PARTICIPLES = frozenset([
+    "built","written","made","done","given","taken","known","seen","found","used",
+    "called","considered","expected","required","provided",
+])
 
-_CONJUNCTIONS = re.compile(r"^(but|and|or|nor|so|yet|for)\b", re.IGNORECASE)
+_HEDGE_WORDS = frozenset([
+    "perhaps","maybe","possibly","probably","might","could","seems","appear","suggest",
+    "indicate","generally","typically","usually","often","sometimes","somewhat","rather",
+    "fairly","quite","relatively","apparently","presumably",
+])
 
-_FIRST_PERSON = re.compile(r"\b(i|me|my|mine|myself|we|us|our|ours|ourselves)\b", re.IGNORECASE)
+_CONJUNCTIONS = frozenset(["but","and","or","nor","so","yet","for"])
+
+_FIRST_PERSON = frozenset(["i","me","my","mine","myself","we","us","our","ours","ourselves"])
+
+# Word → marker category, so each token costs one lookup instead of one per
+# marker list. Passive participles are left out: they only matter right after
+# an auxiliary and are checked there.
+_FIRST_PERSON_MARK, _HEDGE_MARK, _AUXILIARY_MARK = 1, 2, 3
+_MARKERS: Dict[str, int] = {
+    **dict.fromkeys(_FIRST_PERSON, _FIRST_PERSON_MARK),
+    **dict.fromkeys(_HEDGE_WORDS, _HEDGE_MARK),
+    **dict.fromkeys(_PASSIVE_AUXILIARIES, _AUXILIARY_MARK),
+}
+
+# Single-pass tokenizer over the lowercased text. Alternation order matters:
+#   word   — the words used for all per-word features
+#   punct  — punctuation outside words (apostrophes inside words are counted per word)
+#   brk    — whitespace after a sentence terminator, i.e. a sentence boundary
+#   other  — remaining \w runs (digits, non-ASCII) that still count toward sentence length
+_TOKEN_RE = re.compile(
+    r"(?P<word>\b[a-z']+\b)"
+    r"|(?P<punct>[.,;:!?\"'—–-])"
+    r"|(?P<brk>(?<=[.!?])\s+)"
+    r"|(?P<other>\w+)"
+)
+_VOWEL_RUN_RE = re.compile(r"[aeiouy]+")
 
-# Very rough syllable counter — good enough for statistical scoring
+# Very rough syllable counter — good enough for statistical scoring.
+# Word frequencies are Zipfian, so a small cache answers most calls.
+@lru_cache(maxsize=4096)
 def _count_syllables(word: str) -> int:
     word = word.lower().strip(".,!?;:")
     if len(word) <= 3:
         return 1
-    word = re.sub(r"e$", "", word)
-    vowels = re.findall(r"[aeiouy]+", word)
+    if word.endswith("e"):      # silent final e
+        word = word[:-1]
+    vowels = _VOWEL_RUN_RE.findall(word)
     return max(1, len(vowels))
 
 
+# Max number of score results kept per analyzer instance
+_SCORE_CACHE_SIZE = 1024
+
+
 # 1000 most common English words (abbreviated set used as "common word" reference)
 _COMMON_WORDS = frozenset([
     "the","be","to","of","and","a","in","that","have","it","for","not","on","with",
@@ -95,6 +124,8 @@ _COMMON_WORDS = frozenset([
     "also","back","after","use","two","how","our","work","first","well","way","even",
     "new","want","because","any","these","give","day","most","us",
 ])
+# Anything longer than this can't be a common word — skip the set lookup
+_COMMON_MAX_LEN = max(map(len, _COMMON_WORDS))
 
 
 class HumanLikenessAnalyzer:
@@ -123,6 +154,10 @@ class HumanLikenessAnalyzer:
 
     def __init__(self) -> None:
         self._loaded = False
+        # Text digest → result. Keyed on the digest so the cache never holds
+        # on to user text, only the derived scores.
+        self._cache: "OrderedDict[bytes, AnalysisResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def load(self) -> None:
         # Nothing heavy to load right now, but this keeps the interface
@@ -131,31 +166,116 @@ class HumanLikenessAnalyzer:
         logger.info("HumanLikenessAnalyzer loaded.")
 
     def extract_features(self, text: str) -> Tuple[TextFeatures, int, int]:
-        sentences = self._split_sentences(text)
-        words = re.findall(r"\b[a-z']+\b", text.lower())
-        n_words = len(words)
-        n_sentences = max(1, len(sentences))
+        lowered = text.strip().lower()
+
+        # Everything below is gathered in one walk over the text. Module-level
+        # tables and bound methods are pulled into locals because this loop
+        # runs once per token.
+        markers = _MARKERS
+        contractions, conjunctions, participles = _CONTRACTIONS, _CONJUNCTIONS, _PASSIVE_PARTICIPLES
+        common_words, common_max_len = _COMMON_WORDS, _COMMON_MAX_LEN
+        count_syllables = _count_syllables
+        words: List[str] = []
+        add_word = words.append
+        word_len_sum = syllable_sum = 0
+        sent_lengths: List[int] = []
+        sent_len = 0
+        sent_start = 0
+        n_contractions = n_hedges = n_first_person = n_passive = 0
+        n_punct = n_questions = n_exclamations = n_conj_starts = n_rare = 0
+        aux_end = -1                # end offset of the last token if it was a passive auxiliary
+
+        for m in _TOKEN_RE.finditer(lowered):
+            kind = m.lastgroup
+            if kind == "word":
+                word = m.group()
+                start, end = m.span()
+                add_word(word)
+                syllable_sum += count_syllables(word)
+                if len(word) > common_max_len or word not in common_words:
+                    n_rare += 1
+                if "'" not in word:
+                    word_len_sum += len(word)
+                    sent_len += 1
+                    mark = markers.get(word)
+                    if mark == _FIRST_PERSON_MARK:
+                        n_first_person += 1
+                    elif mark == _HEDGE_MARK:
+                        n_hedges += 1
+                    head = word
+                else:
+                    word_len_sum += len(word.strip("'"))
+                    n_punct += word.count("'")
+                    segments = word.split("'")
+                    i = 0
+                    while i < len(segments) - 1:
+                        # Handles stacked forms too, e.g. "you'd've" holds "you'd"
+                        if f"{segments[i]}'{segments[i + 1]}" in contractions:
+                            n_contractions += 1
+                            i += 2
+                        else:
+                            i += 1
+                    for part in segments:
+                        if part:
+                            sent_len += 1
+                            part_mark = markers.get(part)
+                            if part_mark == _FIRST_PERSON_MARK:
+                                n_first_person += 1
+                            elif part_mark == _HEDGE_MARK:
+                                n_hedges += 1
+                    head = segments[0]
+                    mark = markers.get(segments[-1])
+                if start == sent_start and head in conjunctions:
+                    n_conj_starts += 1
+                if (
+                    aux_end >= 0
+                    and (head in participles or (len(head) > 2 and head.endswith("ed")))
+                    and lowered[aux_end:start].isspace()
+                ):
+                    n_passive += 1
+                aux_end = end if mark == _AUXILIARY_MARK else -1
+            elif kind == "punct":
+                n_punct += 1
+                aux_end = -1
+            elif kind == "brk":
+                sent_lengths.append(sent_len)
+                terminator = lowered[m.start() - 1]
+                n_questions += terminator == "?"
+                n_exclamations += terminator == "!"
+                sent_len = 0
+                sent_start = m.end()
+            else:
+                other = m.group()
+                sent_len += 1
+                if aux_end >= 0 and len(other) > 2 and other.endswith("ed") and lowered[aux_end:m.start()].isspace():
+                    n_passive += 1
+                aux_end = -1
 
+        n_words = len(words)
         if n_words == 0:
             return TextFeatures(), 0, 0
 
-        sent_lengths = [len(re.findall(r"\b\w+\b", s)) for s in sentences]
+        sent_lengths.append(sent_len)
+        n_questions += lowered[-1] == "?"
+        n_exclamations += lowered[-1] == "!"
+        n_sentences = len(sent_lengths)
+        mean_sent_len = sum(sent_lengths) / n_sentences
 
         features = TextFeatures(
-            avg_sentence_length=float(np.mean(sent_lengths)),
-            sentence_length_variance=float(np.var(sent_lengths)),
-            avg_word_length=float(np.mean([len(w.strip("'")) for w in words])),
+            avg_sentence_length=mean_sent_len,
+            sentence_length_variance=sum((n - mean_sent_len) ** 2 for n in sent_lengths) / n_sentences,
+            avg_word_length=word_len_sum / n_words,
             lexical_diversity=len(set(words)) / n_words,
-            punctuation_density=len(re.findall(r"[.,;:!?\"'—–-]", text)) / max(1, len(text)),
-            contraction_rate=len(_CONTRACTIONS.findall(text)) / n_words,
-            passive_voice_rate=len(_PASSIVE_INDICATORS.findall(text)) / n_sentences,
-            question_rate=sum(1 for s in sentences if s.strip().endswith("?")) / n_sentences,
-            exclamation_rate=sum(1 for s in sentences if s.strip().endswith("!")) / n_sentences,
-            avg_syllables_per_word=float(np.mean([_count_syllables(w) for w in words])),
-            rare_word_rate=sum(1 for w in words if w not in _COMMON_WORDS) / n_words,
-            first_person_rate=len(_FIRST_PERSON.findall(text)) / n_words,
-            conjunction_start_rate=sum(1 for s in sentences if _CONJUNCTIONS.match(s.strip())) / n_sentences,
-            hedge_word_rate=len(_HEDGE_WORDS.findall(text)) / n_words,
+            punctuation_density=n_punct / max(1, len(text)),
+            contraction_rate=n_contractions / n_words,
+            passive_voice_rate=n_passive / n_sentences,
+            question_rate=n_questions / n_sentences,
+            exclamation_rate=n_exclamations / n_sentences,
+            avg_syllables_per_word=syllable_sum / n_words,
+            rare_word_rate=n_rare / n_words,
+            first_person_rate=n_first_person / n_words,
+            conjunction_start_rate=n_conj_starts / n_sentences,
+            hedge_word_rate=n_hedges / n_words,
         )
         return features, n_words, n_sentences
 
@@ -163,6 +283,33 @@ class HumanLikenessAnalyzer:
         if not self._loaded:
             raise RuntimeError("Analyzer not loaded. Call load() first.")
 
+        # Scoring is deterministic, so repeat texts (e.g. a /transform retry
+        # with different options) are served from the cache.
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return self._fresh_copy(cached)
+
+        result = self._score(text)
+
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > _SCORE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return self._fresh_copy(result)
+
+    @staticmethod
+    def _fresh_copy(result: AnalysisResult) -> AnalysisResult:
+        """
+        The cached result with its own features dict and suggestions list.
+        Freezing the dataclass doesn't freeze those, and a caller editing
+        them must not change what later cache hits return.
+        """
+        return replace(result, features=dict(result.features), suggestions=list(result.suggestions))
+
+    def _score(self, text: str) -> AnalysisResult:
         features, n_words, n_sentences = self.extract_features(text)
         feature_dict = {k: getattr(features, k) for k in self._FEATURE_TARGETS}
 
@@ -201,12 +348,6 @@ class HumanLikenessAnalyzer:
     # Private helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _split_sentences(text: str) -> List[str]:
-        # Simple but reliable sentence splitter
-        parts = re.split(r"(?<=[.!?])\s+", text.strip())
-        return [p for p in parts if p.strip()]
-
     @staticmethod
     def _grade(score: float) -> str:
         if score >= 85:
@@ -12,178 +12,181 @@ Passes (in order):
 import re
 import random
 import logging
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Match, Optional, Pattern, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Contraction map
+# Contractions
+# Applied as one trie-shaped regex (see _CONTRACTION_RE). That relies on no
+# phrase being another phrase plus more words ("it is" / "it is not").
 # ---------------------------------------------------------------------------
-_CONTRACTION_EXPAND = {
+_CONTRACTION_EXPAND: List[Tuple[str, str]] = [
     # to be
-    r"\bit is\b":       "it's",
-    r"\bIt is\b":       "It's",
-    r"\bthat is\b":     "that's",
-    r"\bThat is\b":     "That's",
-    r"\bwhat is\b":     "what's",
-    r"\bWhat is\b":     "What's",
-    r"\bwho is\b":      "who's",
-    r"\bWho is\b":      "Who's",
-    r"\bhere is\b":     "here's",
-    r"\bHere is\b":     "Here's",
-    r"\bthere is\b":    "there's",
-    r"\bThere is\b":    "There's",
-    r"\bwhere is\b":    "where's",
-    r"\bWhere is\b":    "Where's",
-    r"\bhow is\b":      "how's",
-    r"\bHow is\b":      "How's",
-    r"\bthat will\b":   "that'll",
-    r"\bThat will\b":   "That'll",
-    r"\bwhat will\b":   "what'll",
-    r"\bWhat will\b":   "What'll",
-    r"\bthere will\b":  "there'll",
-    r"\bThere will\b":  "There'll",
-    r"\bthere are\b":   "there're",
-    r"\bThere are\b":   "There're",
-    r"\bthese are\b":   "these're",
-    r"\bThese are\b":   "These're",
+    (r"\bit is\b",       "it's"),
+    (r"\bIt is\b",       "It's"),
+    (r"\bthat is\b",     "that's"),
+    (r"\bThat is\b",     "That's"),
+    (r"\bwhat is\b",     "what's"),
+    (r"\bWhat is\b",     "What's"),
+    (r"\bwho is\b",      "who's"),
+    (r"\bWho is\b",      "Who's"),
+    (r"\bhere is\b",     "here's"),
+    (r"\bHere is\b",     "Here's"),
+    (r"\bthere is\b",    "there's"),
+    (r"\bThere is\b",    "There's"),
+    (r"\bwhere is\b",    "where's"),
+    (r"\bWhere is\b",    "Where's"),
+    (r"\bhow is\b",      "how's"),
+    (r"\bHow is\b",      "How's"),
+    (r"\bthat will\b",   "that'll"),
+    (r"\bThat will\b",   "That'll"),
+    (r"\bwhat will\b",   "what'll"),
+    (r"\bWhat will\b",   "What'll"),
+    (r"\bthere will\b",  "there'll"),
+    (r"\bThere will\b",  "There'll"),
+    (r"\bthere are\b",   "there're"),
+    (r"\bThere are\b",   "There're"),
+    (r"\bthese are\b",   "these're"),
+    (r"\bThese are\b",   "These're"),
     # I
-    r"\bI am\b":        "I'm",
-    r"\bI will\b":      "I'll",
-    r"\bI would\b":     "I'd",
-    r"\bI have\b":      "I've",
-    r"\bI had\b":       "I'd",
+    (r"\bI am\b",        "I'm"),
+    (r"\bI will\b",      "I'll"),
+    (r"\bI would\b",     "I'd"),
+    (r"\bI have\b",      "I've"),
+    (r"\bI had\b",       "I'd"),
     # we
-    r"\bwe are\b":      "we're",
-    r"\bWe are\b":      "We're",
-    r"\bwe will\b":     "we'll",
-    r"\bWe will\b":     "We'll",
-    r"\bwe have\b":     "we've",
-    r"\bWe have\b":     "We've",
-    r"\bwe would\b":    "we'd",
-    r"\bWe would\b":    "We'd",
-    r"\bwe had\b":      "we'd",
-    r"\bWe had\b":      "We'd",
+    (r"\bwe are\b",      "we're"),
+    (r"\bWe are\b",      "We're"),
+    (r"\bwe will\b",     "we'll"),
+    (r"\bWe will\b",     "We'll"),
+    (r"\bwe have\b",     "we've"),
+    (r"\bWe have\b",     "We've"),
+    (r"\bwe would\b",    "we'd"),
+    (r"\bWe would\b",    "We'd"),
+    (r"\bwe had\b",      "we'd"),
+    (r"\bWe had\b",      "We'd"),
     # you
-    r"\byou are\b":     "you're",
-    r"\bYou are\b":     "You're",
-    r"\byou will\b":    "you'll",
-    r"\bYou will\b":    "You'll",
-    r"\byou have\b":    "you've",
-    r"\bYou have\b":    "You've",
-    r"\byou would\b":   "you'd",
-    r"\bYou would\b":   "You'd",
-    r"\byou had\b":     "you'd",
-    r"\bYou had\b":     "You'd",
+    (r"\byou are\b",     "you're"),
+    (r"\bYou are\b",     "You're"),
+    (r"\byou will\b",    "you'll"),
+    (r"\bYou will\b",    "You'll"),
+    (r"\byou have\b",    "you've"),
+    (r"\bYou have\b",    "You've"),
+    (r"\byou would\b",   "you'd"),
+    (r"\bYou would\b",   "You'd"),
+    (r"\byou had\b",     "you'd"),
+    (r"\bYou had\b",     "You'd"),
     # they
-    r"\bthey are\b":    "they're",
-    r"\bThey are\b":    "They're",
-    r"\bthey will\b":   "they'll",
-    r"\bThey will\b":   "They'll",
-    r"\bthey have\b":   "they've",
-    r"\bThey have\b":   "They've",
-    r"\bthey would\b":  "they'd",
-    r"\bThey would\b":  "They'd",
-    r"\bthey had\b":    "they'd",
-    r"\bThey had\b":    "They'd",
+    (r"\bthey are\b",    "they're"),
+    (r"\bThey are\b",    "They're"),
+    (r"\bthey will\b",   "they'll"),
+    (r"\bThey will\b",   "They'll"),
+    (r"\bthey have\b",   "they've"),
+    (r"\bThey have\b",   "They've"),
+    (r"\bthey would\b",  "they'd"),
+    (r"\bThey would\b",  "They'd"),
+    (r"\bthey had\b",    "they'd"),
+    (r"\bThey had\b",    "They'd"),
     # he / she
-    r"\bhe is\b":       "he's",
-    r"\bHe is\b":       "He's",
-    r"\bhe will\b":     "he'll",
-    r"\bHe will\b":     "He'll",
-    r"\bhe would\b":    "he'd",
-    r"\bHe would\b":    "He'd",
-    r"\bhe has\b":      "he's",
-    r"\bHe has\b":      "He's",
-    r"\bhe had\b":      "he'd",
-    r"\bHe had\b":      "He'd",
-    r"\bshe is\b":      "she's",
-    r"\bShe is\b":      "She's",
-    r"\bshe will\b":    "she'll",
-    r"\bShe will\b":    "She'll",
-    r"\bshe would\b":   "she'd",
-    r"\bShe would\b":   "She'd",
-    r"\bshe has\b":     "she's",
-    r"\bShe has\b":     "She's",
-    r"\bshe had\b":     "she'd",
-    r"\bShe had\b":     "She'd",
+    (r"\bhe is\b",       "he's"),
+    (r"\bHe is\b",       "He's"),
+    (r"\bhe will\b",     "he'll"),
+    (r"\bHe will\b",     "He'll"),
+    (r"\bhe would\b",    "he'd"),
+    (r"\bHe would\b",    "He'd"),
+    (r"\bhe has\b",      "he's"),
+    (r"\bHe has\b",      "He's"),
+    (r"\bhe had\b",      "he'd"),
+    (r"\bHe had\b",      "He'd"),
+    (r"\bshe is\b",      "she's"),
+    (r"\bShe is\b",      "She's"),
+    (r"\bshe will\b",    "she'll"),
+    (r"\bShe will\b",    "She'll"),
+    (r"\bshe would\b",   "she'd"),
+    (r"\bShe would\b",   "She'd"),
+    (r"\bshe has\b",     "she's"),
+    (r"\bShe has\b",     "She's"),
+    (r"\bshe had\b",     "she'd"),
+    (r"\bShe had\b",     "She'd"),
     # it
-    r"\bit will\b":     "it'll",
-    r"\bIt will\b":     "It'll",
-    r"\bit would\b":    "it'd",
-    r"\bIt would\b":    "It'd",
-    r"\bit has\b":      "it's",
-    r"\bIt has\b":      "It's",
-    r"\bit had\b":      "it'd",
-    r"\bIt had\b":      "It'd",
+    (r"\bit will\b",     "it'll"),
+    (r"\bIt will\b",     "It'll"),
+    (r"\bit would\b",    "it'd"),
+    (r"\bIt would\b",    "It'd"),
+    (r"\bit has\b",      "it's"),
+    (r"\bIt has\b",      "It's"),
+    (r"\bit had\b",      "it'd"),
+    (r"\bIt had\b",      "It'd"),
     # that / who / which
-    r"\bthat would\b":  "that'd",
-    r"\bThat would\b":  "That'd",
-    r"\bthat have\b":   "that've",
-    r"\bThat have\b":   "That've",
-    r"\bwho will\b":    "who'll",
-    r"\bWho will\b":    "Who'll",
-    r"\bwho would\b":   "who'd",
-    r"\bWho would\b":   "Who'd",
-    r"\bwho have\b":    "who've",
-    r"\bWho have\b":    "Who've",
+    (r"\bthat would\b",  "that'd"),
+    (r"\bThat would\b",  "That'd"),
+    (r"\bthat have\b",   "that've"),
+    (r"\bThat have\b",   "That've"),
+    (r"\bwho will\b",    "who'll"),
+    (r"\bWho will\b",    "Who'll"),
+    (r"\bwho would\b",   "who'd"),
+    (r"\bWho would\b",   "Who'd"),
+    (r"\bwho have\b",    "who've"),
+    (r"\bWho have\b",    "Who've"),
     # negatives
-    r"\bdo not\b":      "don't",
-    r"\bDo not\b":      "Don't",
-    r"\bdoes not\b":    "doesn't",
-    r"\bDoes not\b":    "Doesn't",
-    r"\bdid not\b":     "didn't",
-    r"\bDid not\b":     "Didn't",
-    r"\bcannot\b":      "can't",
-    r"\bCannot\b":      "Can't",
-    r"\bcould not\b":   "couldn't",
-    r"\bCould not\b":   "Couldn't",
-    r"\bwould not\b":   "wouldn't",
-    r"\bWould not\b":   "Wouldn't",
-    r"\bshould not\b":  "shouldn't",
-    r"\bShould not\b":  "Shouldn't",
-    r"\bwill not\b":    "won't",
-    r"\bWill not\b":    "Won't",
-    r"\bmust not\b":    "mustn't",
-    r"\bMust not\b":    "Mustn't",
-    r"\bneed not\b":    "needn't",
-    r"\bNeed not\b":    "Needn't",
-    r"\bis not\b":      "isn't",
-    r"\bIs not\b":      "Isn't",
-    r"\bare not\b":     "aren't",
-    r"\bAre not\b":     "Aren't",
-    r"\bwas not\b":     "wasn't",
-    r"\bWas not\b":     "Wasn't",
-    r"\bwere not\b":    "weren't",
-    r"\bWere not\b":    "Weren't",
-    r"\bhave not\b":    "haven't",
-    r"\bHave not\b":    "Haven't",
-    r"\bhas not\b":     "hasn't",
-    r"\bHas not\b":     "Hasn't",
-    r"\bhad not\b":     "hadn't",
-    r"\bHad not\b":     "Hadn't",
-    r"\bmight not\b":   "mightn't",
-    r"\bMight not\b":   "Mightn't",
-    r"\bdare not\b":    "daren't",
-    r"\bDare not\b":    "Daren't",
-    r"\bought not\b":   "oughtn't",
-    r"\bOught not\b":   "Oughtn't",
+    (r"\bdo not\b",      "don't"),
+    (r"\bDo not\b",      "Don't"),
+    (r"\bdoes not\b",    "doesn't"),
+    (r"\bDoes not\b",    "Doesn't"),
+    (r"\bdid not\b",     "didn't"),
+    (r"\bDid not\b",     "Didn't"),
+    (r"\bcannot\b",      "can't"),
+    (r"\bCannot\b",      "Can't"),
+    (r"\bcould not\b",   "couldn't"),
+    (r"\bCould not\b",   "Couldn't"),
+    (r"\bwould not\b",   "wouldn't"),
+    (r"\bWould not\b",   "Wouldn't"),
+    (r"\bshould not\b",  "shouldn't"),
+    (r"\bShould not\b",  "Shouldn't"),
+    (r"\bwill not\b",    "won't"),
+    (r"\bWill not\b",    "Won't"),
+    (r"\bmust not\b",    "mustn't"),
+    (r"\bMust not\b",    "Mustn't"),
+    (r"\bneed not\b",    "needn't"),
+    (r"\bNeed not\b",    "Needn't"),
+    (r"\bis not\b",      "isn't"),
+    (r"\bIs not\b",      "Isn't"),
+    (r"\bare not\b",     "aren't"),
+    (r"\bAre not\b",     "Aren't"),
+    (r"\bwas not\b",     "wasn't"),
+    (r"\bWas not\b",     "Wasn't"),
+    (r"\bwere not\b",    "weren't"),
+    (r"\bWere not\b",    "Weren't"),
+    (r"\bhave not\b",    "haven't"),
+    (r"\bHave not\b",    "Haven't"),
+    (r"\bhas not\b",     "hasn't"),
+    (r"\bHas not\b",     "Hasn't"),
+    (r"\bhad not\b",     "hadn't"),
+    (r"\bHad not\b",     "Hadn't"),
+    (r"\bmight not\b",   "mightn't"),
+    (r"\bMight not\b",   "Mightn't"),
+    (r"\bdare not\b",    "daren't"),
+    (r"\bDare not\b",    "Daren't"),
+    (r"\bought not\b",   "oughtn't"),
+    (r"\bOught not\b",   "Oughtn't"),
     # misc
-    r"\blet us\b":      "let's",
-    r"\bLet us\b":      "Let's",
-    r"\bcome on\b":     "c'mon",
-    r"\bCome on\b":     "C'mon",
-    r"\bgoing to\b":    "gonna",
-    r"\bGoing to\b":    "Gonna",
-    r"\bwant to\b":     "wanna",
-    r"\bWant to\b":     "Wanna",
-    r"\bkind of\b":     "kinda",
-    r"\bKind of\b":     "Kinda",
-    r"\bout of\b":      "outta",
-    r"\bOut of\b":      "Outta",
-    r"\bsort of\b":     "sorta",
-    r"\bSort of\b":     "Sorta",
-}
+    (r"\blet us\b",      "let's"),
+    (r"\bLet us\b",      "Let's"),
+    (r"\bcome on\b",     "c'mon"),
+    (r"\bCome on\b",     "C'mon"),
+    (r"\bgoing to\b",    "gonna"),
+    (r"\bGoing to\b",    "Gonna"),
+    (r"\bwant to\b",     "wanna"),
+    (r"\bWant to\b",     "Wanna"),
+    (r"\bkind of\b",     "kinda"),
+    (r"\bKind of\b",     "Kinda"),
+    (r"\bout of\b",      "outta"),
+    (r"\bOut of\b",      "Outta"),
+    (r"\bsort of\b",     "sorta"),
+    (r"\bSort of\b",     "Sorta"),
+]
 
 # ---------------------------------------------------------------------------
 # Formal → casual phrase substitutions
@@ -453,7 +456,7 @@ _FORMAL_TO_CASUAL: List[Tuple[str, str]] = [
     (r"\bFrom the standpoint of\b",                 "For"),
     (r"\bfrom the point of view of\b",              "for"),
     (r"\bFrom the point of view of\b",              "For"),
-    (r"\bfrom a [a-z]+ perspective\b",              ""),   # "from a business perspective" → ""
+    (r" ?\bfrom a [a-z]+ perspective\b",             ""),   # "from a business perspective" → ""
     (r"\bit should also be noted that\b",           "also,"),
     (r"\bIt should also be noted that\b",           "Also,"),
     (r"\bthe fact that\b",                          "that"),
@@ -720,8 +723,6 @@ _FORMAL_TO_CASUAL: List[Tuple[str, str]] = [
     (r"\bAbsolutely essential\b",       "Essential"),
     (r"\babsolutely necessary\b",       "necessary"),
     (r"\bAbsolutely necessary\b",       "Necessary"),
-    (r"\bcompletely eliminate\b",       "eliminate"),
-    (r"\bCompletely eliminate\b",       "Eliminate"),
     (r"\bcompletely free\b",            "free"),
     (r"\bCompletely free\b",            "Free"),
     (r"\bcompletely different\b",       "different"),
@@ -740,9 +741,7 @@ _FORMAL_TO_CASUAL: List[Tuple[str, str]] = [
     (r"\bVery significant\b",           "Significant"),
     (r"\bvery crucial\b",               "crucial"),
     (r"\bVery crucial\b",               "Crucial"),
-    (r"\bbasically\b",                  ""),
-    (r"\bessentially\b",                ""),
-    (r"\bfundamentally\b",              ""),
+    (r" ?\b(?:basically|essentially|fundamentally)\b", ""),
     (r"\bultimately\b",                 "in the end"),
     (r"\bUltimately\b",                 "In the end"),
     (r"\bin essence\b",                 "at its core"),
@@ -783,6 +782,7 @@ _FORMAL_TO_CASUAL: List[Tuple[str, str]] = [
 
 # ---------------------------------------------------------------------------
 # Passive voice → active rewrites
+# Applied as one trie-shaped regex (see _PASSIVE_RE), like the contractions.
 # ---------------------------------------------------------------------------
 _PASSIVE_REWRITES: List[Tuple[str, str]] = [
     (r"\bit can be seen that\b",            "we can see that"),
@@ -922,14 +922,290 @@ _HUMAN_OPENERS = [
     "To put it plainly,",
 ]
 
+# ---------------------------------------------------------------------------
+# Compiled rule tables
+# Patterns are compiled once at import. Each rule is gated on the whole
+# words every match of it contains: the formal pass splits the text into
+# a set of lowercase words once, and a rule only runs its regex scan when
+# its words are all in that set — a few hash lookups instead of a scan.
+# Rules still apply one after another: a replacement can create a match
+# for a later rule ("in practice" → "in reality" → "actually"), so a
+# single combined scan would change the output.
+# ---------------------------------------------------------------------------
+_LITERAL_RE = re.compile(r"\\b([A-Za-z' ]+)\\b")
+_WORD_RE = re.compile(r"[a-z]+")
+
+_Replacement = Union[str, Callable[[Match[str]], str]]
+# pattern, replacement, gates (the rule runs if any gate's words are all
+# present), and the words its replacement can add to the text
+_CompiledRule = Tuple[Pattern[str], _Replacement, Tuple[FrozenSet[str], ...], FrozenSet[str]]
+# The same, before compiling: the pattern is still its source string
+_RuleUnit = Tuple[str, _Replacement, Tuple[FrozenSet[str], ...], FrozenSet[str]]
+
+
+def _literal_key(pattern: str) -> Optional[str]:
+    """The phrase a \\b-anchored literal pattern matches, or None for real regexes."""
+    m = _LITERAL_RE.fullmatch(pattern)
+    return m.group(1) if m else None
+
+
+# The variable parts the regex rules use: [a-z]+ word slots, (?:a|b)
+# groups of plain alternatives, and single optional characters (",?", " ?")
+_VARIABLE_PART_RE = re.compile(r"\[[A-Za-z-]+\]\+|\(\?:[A-Za-z' |]+\)|.\?")
+_PLAIN_RE = re.compile(r"[A-Za-z' ,]*")
+_OPTIONAL_SEPARATOR_RE = re.compile(r"([ ,])\?(?=[ ,])")
+
+
+def _gate_words(pattern: str) -> FrozenSet[str]:
+    """
+    The lowercase words every match of pattern contains whole, used to
+    skip the rule cheaply. A word counts only if the literal text on both
+    sides of it is a non-letter (a space, comma, apostrophe or \\b), so it
+    can't be the stub of a longer word in the text. Empty — the rule
+    always runs — if the pattern has any other shape.
+    """
+    spaced = pattern.replace(r"\b", " ")
+    # An optional non-letter followed by a non-letter borders a word
+    # whether or not it's there (",?\b" in "However,?\b")
+    spaced = _OPTIONAL_SEPARATOR_RE.sub(r"\1", spaced)
+    pieces = _VARIABLE_PART_RE.split(spaced)
+    if not all(_PLAIN_RE.fullmatch(piece) for piece in pieces):
+        return frozenset()
+    return frozenset(
+        m.group()
+        for piece in pieces
+        for m in _WORD_RE.finditer(piece.lower())
+        if 0 < m.start() and m.end() < len(piece)
+    )
+
+
+# A leading \b before a pattern's first letter, bare, as [Xx] or as ([Xx])
+_LEADING_BOUNDARY_RE = re.compile(r"(?:^|(?<=\|))\\b(\(?(?:[A-Za-z]|\[[A-Za-z]+\])\)?)")
+
+
+def _boundary_after_first(pattern: str) -> str:
+    """
+    Moves each branch's leading \\b behind its first letter as (?<!\\w.),
+    which tests the same thing from one character later. A pattern that
+    opens with an assertion gets no prefix search, so the engine tries a
+    match at every offset; one that opens with a letter lets it skip
+    straight to the next occurrence of that letter.
+    """
+    return _LEADING_BOUNDARY_RE.sub(r"\1(?<!\\w.)", pattern)
+
+
+def _case_pair(lower: str, title: str) -> Callable[[Match[str]], str]:
+    """Replacement for a merged lower/Title rule pair, picked by the match's first letter."""
+    def repl(m: Match[str]) -> str:
+        return title if m.group()[0].isupper() else lower
+    return repl
+
+
+def _compile(rules: Iterable[Tuple[str, str]]) -> Tuple[_CompiledRule, ...]:
+    """
+    Compiles a rule table, shrinking it in two steps without changing what
+    it does:
+
+    - Adjacent literal rules that differ only in the case of their first
+      letter ("it is"/"It is") become one rule matching [Ii]t is — not
+      re.IGNORECASE, which would also rewrite "IT IS".
+    - A run of adjacent rules with the same replacement ("Consequently",
+      "Therefore", "Thus" → "So,") becomes one alternation, gated on any
+      of their gates.
+    """
+    rules = list(rules)
+    units: List[_RuleUnit] = []
+    i = 0
+    while i < len(rules):
+        pattern, repl = rules[i]
+        key = _literal_key(pattern)
+        if key and i + 1 < len(rules):
+            next_pattern, next_repl = rules[i + 1]
+            next_key = _literal_key(next_pattern)
+            if (
+                next_key
+                and key[1:] == next_key[1:]
+                and key[0] != next_key[0]
+                and key[0].lower() == next_key[0].lower()
+            ):
+                adds = frozenset(_WORD_RE.findall(f"{repl} {next_repl}".lower()))
+                if key[0].isupper():
+                    key, next_key, repl, next_repl = next_key, key, next_repl, repl
+                letters = next_key[0] + key[0]
+                if repl == next_repl:
+                    merged, pair = rf"\b[{letters}]{key[1:]}\b", repl
+                elif repl[:1] == key[0] and next_repl[:1] == next_key[0] and repl[1:] == next_repl[1:]:
+                    # The replacement keeps the matched first letter ("it is" →
+                    # "it's"), so a template does it without a Python callback
+                    merged, pair = rf"\b([{letters}]){key[1:]}\b", r"\g<1>" + repl[1:]
+                else:
+                    merged, pair = rf"\b[{letters}]{key[1:]}\b", _case_pair(repl, next_repl)
+                units.append((merged, pair, (_gate_words(pattern),), adds))
+                i += 2
+                continue
+        # An empty gate is a subset of every word set, so a rule without
+        # one always runs
+        adds = frozenset(_WORD_RE.findall(repl.lower()))
+        units.append((pattern, repl, (_gate_words(pattern),), adds))
+        i += 1
+
+    compiled: List[_CompiledRule] = []
+    i = 0
+    while i < len(units):
+        pattern, repl, gates, adds = units[i]
+        j = i + 1
+        # Templates refer to their own group by number, so they never merge
+        if isinstance(repl, str) and "\\g<" not in repl:
+            while j < len(units) and units[j][1] == repl:
+                j += 1
+        if j - i > 1:
+            pattern = "|".join(unit[0] for unit in units[i:j])
+            gates = tuple(gate for unit in units[i:j] for gate in unit[2])
+        compiled.append((re.compile(_boundary_after_first(pattern)), repl, gates, adds))
+        i = j
+    return tuple(compiled)
+
+
+# Frozen at import and shared by every TextTransformer; instances only
+# hold their flags and RNG
+_FORMAL_COMPILED = _compile(_FORMAL_TO_CASUAL)
+
+def _apply_rules(text: str, rules: Tuple[_CompiledRule, ...]) -> str:
+    """
+    The substitution kernel shared by the rule passes: each rule in order,
+    skipped unless all the words of one of its gates are in the text. The
+    text is split into words once; each substitution adds its
+    replacement's words, so the set stays a superset of the text's words
+    and a rule is never wrongly skipped.
+    """
+    words = set(_WORD_RE.findall(text.lower()))
+    for pattern, repl, gates, adds in rules:
+        for gate in gates:
+            if gate <= words:
+                text = pattern.sub(repl, text)
+                words |= adds
+                break
+    return text
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Builds a regex matching any of phrases, factored into a character
+    trie: "it is|it will|I am" becomes "(?:it\\ (?:is|will)|I\\ am)".
+    A flat alternation retries every phrase from scratch at each position;
+    the trie reads each character once per position, so the engine can
+    reject a non-matching position after one or two characters.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}       # a phrase ends here
+
+    def walk(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + walk(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A phrase ending here while longer ones continue: the rest is optional
+        return f"(?:{body})?" if "" in node else body
+
+    return walk(trie)
+
+
+# Contractions and passive rewrites are the exception: within each table
+# no rule creates or overlaps another rule's phrase out of order, so each
+# table runs as a single alternation — one scan, one dict lookup per
+# match. No phrase is another plus more words, so at most one can match
+# at any position and the trie order doesn't matter.
+def _phrase_map(rules: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Phrase → replacement for a table of literal rules; a real regex in it is a bug."""
+    table: Dict[str, str] = {}
+    for pattern, repl in rules:
+        phrase = _literal_key(pattern)
+        if phrase is None:
+            raise ValueError(f"Not a literal \\b-anchored phrase: {pattern!r}")
+        table[phrase] = repl
+    return table
+
+
+_CONTRACTION_MAP = _phrase_map(_CONTRACTION_EXPAND)
+_CONTRACTION_RE = re.compile(r"\b" + _trie_pattern(_CONTRACTION_MAP) + r"\b")
+
+_PASSIVE_MAP = _phrase_map(_PASSIVE_REWRITES)
+_PASSIVE_RE = re.compile(r"\b" + _trie_pattern(_PASSIVE_MAP) + r"\b")
+
+
+def _contract(m: Match[str]) -> str:
+    return _CONTRACTION_MAP[m.group()]
+
+
+def _activate(m: Match[str]) -> str:
+    return _PASSIVE_MAP[m.group()]
+
+
+# Sentence-ending punctuation and the whitespace after it, and the
+# sentence starts that get a casual opener. The break leads with the
+# [.!?] class rather than a lookbehind, so the engine can skip ahead to
+# candidate characters instead of testing the lookbehind at every offset;
+# match ends (where the next sentence starts) are the same either way.
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]\s+")
+_THE_THIS_RE = re.compile(r"(?:The|This)\b")
+
+# Artifact fixes, in one scan: space before a period, doubled commas
+# like "So, ,", spaces after a newline, and runs of spaces left by
+# empty-string replacements. Gives the same result as applying the four
+# fixes one after another. Every fix starts with two characters from
+# [\s,][\s,.]; the lookahead rejects ordinary single spaces before any
+# branch is tried. Each branch captures the one character it keeps, and
+# groups that didn't take part expand to "", so a plain template does
+# the replacing without a Python callback per match.
+_CLEANUP_RE = re.compile(
+    r"(?=[\s,][\s,.])"
+    r"(?:\s+(?P<dot>\.)|(?P<comma>,)\s*,|(?P<nl>\n) +|(?P<sp> ) +)"
+)
+_CLEANUP_TEMPLATE = r"\g<dot>\g<comma>\g<nl>\g<sp>"
+
+
+# Opener source for transformers created without a seed
+_SHARED_RNG = random.Random()
+
+# Joins the texts of a transform_many batch. No rule pattern matches it.
+_BATCH_SEP = "\0"
+
+# Rule-pass results kept across all transformers that opt in with
+# cache=True. Entries hold the input text itself, so the API never opts in
+# (it promises not to keep user text); it's for offline and batch callers.
+# Inputs are capped at MAX_TEXT_LENGTH, so this bounds memory to a few MB.
+_RULES_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_RULES_CACHE_SIZE)
+def _run_rules(text: str, rules: Tuple[Callable[[str], str], ...]) -> str:
+    """
+    Runs the deterministic rule passes over text. Everything up to sentence
+    variation depends only on the text and the enabled passes, so repeated
+    inputs are served from the cache.
+    """
+    for apply in rules:
+        text = apply(text)
+    return text
+
 
 class TextTransformer:
     """
     Applies a configurable pipeline of transformations to a text string.
-    Each pass is isolated and toggleable. Transforms run in order so
-    later passes do not undo earlier ones.
+    Each pass is isolated and toggleable; the set of enabled passes is
+    fixed at construction, so the option flags are read-only. Transforms
+    run in order so later passes do not undo earlier ones.
     """
 
+    __slots__ = (
+        "_use_contractions", "_simplify_formal", "_vary_sentences", "_rewrite_passive",
+        "_cache", "_rng", "_rules", "_run",
+    )
+
     def __init__(
         self,
         use_contractions: bool = True,
@@ -937,75 +1213,135 @@ class TextTransformer:
         vary_sentences: bool = True,
         rewrite_passive: bool = True,
         seed: int | None = None,
+        cache: bool = False,
     ):
-        self.use_contractions = use_contractions
-        self.simplify_formal = simplify_formal
-        self.vary_sentences = vary_sentences
-        self.rewrite_passive = rewrite_passive
-        self._rng = random.Random(seed)
+        self._use_contractions = use_contractions
+        self._simplify_formal = simplify_formal
+        self._vary_sentences = vary_sentences
+        self._rewrite_passive = rewrite_passive
+        self._cache = cache
+        # Unseeded transformers share one generator instead of each seeding
+        # a fresh Mersenne Twister from OS entropy
+        self._rng = random.Random(seed) if seed is not None else _SHARED_RNG
+        # The enabled rule passes, in pipeline order, resolved once here so
+        # transform() doesn't re-check the flags on every call. They're
+        # plain functions, so instances with the same options share
+        # _run_rules cache entries.
+        self._rules: Tuple[Callable[[str], str], ...] = tuple(
+            apply
+            for enabled, apply in (
+                (rewrite_passive, self._apply_passive_rewrites),
+                (simplify_formal, self._apply_formal_simplification),
+                (use_contractions, self._apply_contractions),
+            )
+            if enabled
+        )
+        if not vary_sentences:
+            # Nothing random runs after the rule passes, so the whole
+            # pipeline is deterministic and the clean-up is cached with them
+            self._rules += (self._clean_up,)
+        # Opt-in only: the cache keeps input text after transform() returns
+        self._run = _run_rules if cache else _run_rules.__wrapped__
 
-    def transform(self, text: str) -> str:
-        if not text or not text.strip():
-            return text
+    @property
+    def use_contractions(self) -> bool:
+        return self._use_contractions
+
+    @property
+    def simplify_formal(self) -> bool:
+        return self._simplify_formal
+
+    @property
+    def vary_sentences(self) -> bool:
+        return self._vary_sentences
 
-        result = text
+    @property
+    def rewrite_passive(self) -> bool:
+        return self._rewrite_passive
 
-        if self.rewrite_passive:
-            result = self._apply_passive_rewrites(result)
+    @property
+    def cache(self) -> bool:
+        return self._cache
 
-        if self.simplify_formal:
-            result = self._apply_formal_simplification(result)
+    def transform(self, text: str) -> str:
+        if not text or text.isspace():
+            return text
 
-        if self.use_contractions:
-            result = self._apply_contractions(result)
+        result = self._run(text, self._rules)
 
-        if self.vary_sentences:
-            result = self._apply_sentence_variation(result)
+        if self._vary_sentences:
+            result = self._clean_up(self._apply_sentence_variation(result))
 
-        result = self._clean_up(result)
         return result
 
+    def transform_many(self, texts: Iterable[str]) -> List[str]:
+        """
+        Same as [self.transform(t) for t in texts], but the rule passes run
+        once over all the texts joined by NUL. No rule can match a NUL, so
+        nothing crosses from one text into the next, and the per-call cost
+        of the passes is paid once per batch. Sentence variation and the
+        clean-up still run per text, in order, so seeded output matches.
+        """
+        results = list(texts)
+        batch = [i for i, text in enumerate(results) if text and not text.isspace()]
+        if any(_BATCH_SEP in results[i] for i in batch):
+            return [self.transform(text) for text in results]
+
+        # Uncached: a joined batch is unlikely to repeat and could be large
+        joined = _run_rules.__wrapped__(_BATCH_SEP.join(results[i] for i in batch), self._rules)
+        for i, result in zip(batch, joined.split(_BATCH_SEP)):
+            if self._vary_sentences:
+                result = self._clean_up(self._apply_sentence_variation(result))
+            else:
+                # Clean-up already ran with the passes; only its strip
+                # has to be redone per text
+                result = result.strip()
+            results[i] = result
+        return results
+
     # ------------------------------------------------------------------
     # Transformation passes
     # ------------------------------------------------------------------
 
-    def _apply_contractions(self, text: str) -> str:
-        for pattern, replacement in _CONTRACTION_EXPAND.items():
-            text = re.sub(pattern, replacement, text)
-        return text
+    @staticmethod
+    def _apply_contractions(text: str) -> str:
+        return _CONTRACTION_RE.sub(_contract, text)
 
-    def _apply_formal_simplification(self, text: str) -> str:
-        for pattern, replacement in _FORMAL_TO_CASUAL:
-            text = re.sub(pattern, replacement, text)
-        return text
+    @staticmethod
+    def _apply_formal_simplification(text: str) -> str:
+        return _apply_rules(text, _FORMAL_COMPILED)
 
-    def _apply_passive_rewrites(self, text: str) -> str:
-        for pattern, replacement in _PASSIVE_REWRITES:
-            text = re.sub(pattern, replacement, text)
-        return text
+    @staticmethod
+    def _apply_passive_rewrites(text: str) -> str:
+        return _PASSIVE_RE.sub(_activate, text)
 
     def _apply_sentence_variation(self, text: str) -> str:
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        if len(sentences) < 4:
+        # Only the start offsets of sentences 2.. are needed; the text is
+        # sliced around the few sentences that get an opener, so the
+        # original whitespace between sentences is kept as-is.
+        # Every break follows its own . ! or ?, so fewer than three of them
+        # means fewer than four sentences — skip the regex scan entirely
+        if text.count(".") + text.count("!") + text.count("?") < 3:
+            return text
+        starts = [m.end() for m in _SENTENCE_BREAK_RE.finditer(text)]
+        if len(starts) < 3:
             return text
 
-        result_parts = []
-        for i, sent in enumerate(sentences):
-            if i > 0 and i % 5 == 0 and re.match(r"^(The|This)\b", sent):
-                opener = self._rng.choice(_HUMAN_OPENERS)
-                sent = f"{opener} {sent[0].lower()}{sent[1:]}"
-            result_parts.append(sent)
+        # Every fifth sentence (index 5, 10, ...) is a candidate
+        targets = [start for start in starts[4::5] if _THE_THIS_RE.match(text, start)]
+        if not targets:
+            return text
 
-        return " ".join(result_parts)
+        # All openers drawn in one call rather than one RNG call per sentence
+        openers = self._rng.choices(_HUMAN_OPENERS, k=len(targets))
+        parts = []
+        last = 0
+        for start, opener in zip(targets, openers):
+            parts += (text[last:start], opener, " ", text[start].lower())
+            last = start + 1
+        parts.append(text[last:])
+        return "".join(parts)
 
     @staticmethod
     def _clean_up(text: str) -> str:
-        # Fix double spaces from empty-string replacements (e.g. "basically" → "")
-        text = re.sub(r" {2,}", " ", text)
-        # Fix artifact commas like "So, ,"
-        text = re.sub(r",\s*,", ",", text)
-        # Fix space before period
-        text = re.sub(r"\s+\.", ".", text)
-        # Fix leading space after newlines
-        text = re.sub(r"\n ", "\n", text)
-        return text.strip()
\ No newline at end of file
+        return _CLEANUP_RE.sub(_CLEANUP_TEMPLATE, text).strip()
@@ -10,16 +10,18 @@ import os
 # This is needed when running `python main.py` directly instead of via uvicorn.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from api.routers import transform, analyze, health
-from api.middleware.rate_limit import RateLimitMiddleware
+from api.middleware.concurrency import ConcurrencyLimitMiddleware
+from api.middleware.rate_limit import RateLimitMiddleware, run_clock
 from api.middleware.security import SecurityHeadersMiddleware
 from core.config import settings
 from core.logging_config import setup_logging
@@ -28,15 +30,26 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def _log_load_failure(task: "asyncio.Task[None]") -> None:
+    # Retrieving the exception here also keeps asyncio from warning that it
+    # was never retrieved when no request arrives to await the task
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Analyzer failed to load", exc_info=task.exception())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting HumanifyAI...")
-    # Warm up the analyzer model on startup
+    # Load the analyzer in the background so startup doesn't wait on it;
+    # endpoints that need it await analyzer_ready (see api.dependencies)
     from core.analyzer import HumanLikenessAnalyzer
     app.state.analyzer = HumanLikenessAnalyzer()
-    app.state.analyzer.load()
-    logger.info("Analyzer ready.")
+    ready = asyncio.create_task(asyncio.to_thread(app.state.analyzer.load))
+    ready.add_done_callback(_log_load_failure)
+    app.state.analyzer_ready = ready
+    clock = asyncio.create_task(run_clock())
     yield
+    clock.cancel()
     logger.info("Shutting down HumanifyAI.")
 
 
@@ -48,9 +61,14 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
     lifespan=lifespan,
+    # Responses carry feature dicts and whole transformed texts; orjson
+    # encodes them far faster than the stdlib json encoder.
+    default_response_class=ORJSONResponse,
 )
 
 # --- Middleware ---
+# Innermost, so rate-limited requests are rejected before taking a slot
+app.add_middleware(ConcurrencyLimitMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RateLimitMiddleware, max_requests=60, window_seconds=60)
 app.add_middleware(
@@ -61,7 +79,7 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization"],
 )
 
-# --- Static files & templates ---
+# --- Static files (dashboard templates live in api.routers.dashboard) ---
 app.mount("/static", StaticFiles(directory="dashboard/static"), name="static")
 
 # --- Routers ---
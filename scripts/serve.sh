@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# serve.sh — start the production server (no reload).
+# Usage: ./scripts/serve.sh [port]
+#
+# uvloop and httptools ship with uvicorn[standard]. Single worker on
+# purpose: the rate limiter keeps its state in process memory.
+
+set -euo pipefail
+
+PORT="${1:-8000}"
+
+echo "Serving HumanifyAI on http://0.0.0.0:${PORT}"
+exec uvicorn main:app --host 0.0.0.0 --port "$PORT" \
+  --loop uvloop --http httptools \
+  --backlog 2048 --limit-concurrency 1024 --timeout-keep-alive 15
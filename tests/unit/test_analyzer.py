@@ -91,6 +91,14 @@ class TestScore:
         assert isinstance(result.features, dict)
         assert len(result.features) > 0
 
+    def test_cached_result_not_shared(self, analyzer):
+        first = analyzer.score(AI_TEXT)
+        first.suggestions.append("edited by caller")
+        first.features.clear()
+        second = analyzer.score(AI_TEXT)
+        assert "edited by caller" not in second.suggestions
+        assert second.features
+
     def test_word_and_sentence_count(self, analyzer):
         result = analyzer.score(HUMAN_TEXT)
         assert result.word_count > 0
@@ -101,6 +109,15 @@ class TestScore:
         with pytest.raises(RuntimeError, match="not loaded"):
             fresh.score("some text")
 
+    def test_repeat_score_served_from_cache(self, analyzer, monkeypatch):
+        first = analyzer.score(HUMAN_TEXT)
+
+        def no_rescore(text):
+            raise AssertionError("cache miss")
+
+        monkeypatch.setattr(analyzer, "_score", no_rescore)
+        assert analyzer.score(HUMAN_TEXT) == first
+
     def test_short_text(self, analyzer):
         result = analyzer.score("Hello there!")
         assert result.score >= 0
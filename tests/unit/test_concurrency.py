@@ -0,0 +1,54 @@
+"""
+Unit tests for ConcurrencyLimitMiddleware.
+Run: pytest tests/unit/test_concurrency.py -v
+"""
+
+import asyncio
+
+from api.middleware.concurrency import ConcurrencyLimitMiddleware
+
+
+class _SlowApp:
+    """ASGI app that records how many calls are running at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, scope, receive, send):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+def run_burst(path: str, n: int, max_concurrent: int) -> int:
+    inner = _SlowApp()
+    app = ConcurrencyLimitMiddleware(inner, max_concurrent=max_concurrent)
+
+    async def burst():
+        scope = {"type": "http", "path": path}
+        await asyncio.gather(*(app(scope, _receive, _send) for _ in range(n)))
+
+    asyncio.run(burst())
+    return inner.peak
+
+
+class TestConcurrencyLimit:
+    def test_caps_in_flight_requests(self):
+        assert run_burst("/api/v1/analyze", n=10, max_concurrent=3) == 3
+
+    def test_all_queued_requests_complete(self):
+        # A lost notify would leave gather() waiting forever
+        assert run_burst("/api/v1/transform", n=20, max_concurrent=1) == 1
+
+    def test_other_paths_not_limited(self):
+        assert run_burst("/api/health", n=10, max_concurrent=1) == 10
@@ -0,0 +1,35 @@
+"""
+Unit tests for the shared router dependencies.
+Run: pytest tests/unit/test_dependencies.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, Request
+
+from api.dependencies import get_analyzer
+
+
+def _request(load):
+    """A stand-in request whose app is loading its analyzer with load()."""
+    async def call():
+        state = SimpleNamespace(analyzer="analyzer")
+        state.analyzer_ready = asyncio.create_task(asyncio.to_thread(load))
+        request = Request({"type": "http", "app": SimpleNamespace(state=state)})
+        return await get_analyzer(request)
+    return call
+
+
+class TestGetAnalyzer:
+    def test_waits_for_load(self):
+        assert asyncio.run(_request(lambda: None)()) == "analyzer"
+
+    def test_failed_load_is_503(self):
+        def load():
+            raise OSError("model missing")
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(_request(load)())
+        assert exc.value.status_code == 503
@@ -0,0 +1,82 @@
+"""
+Unit tests for RateLimitMiddleware.
+Run: pytest tests/unit/test_rate_limit.py -v
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware import rate_limit
+from api.middleware.rate_limit import RateLimitMiddleware
+
+
+def make_client(**limits) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/static/ping")
+    async def static_ping():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, **limits)
+    return TestClient(app)
+
+
+def hit(client: TestClient, ip: str = "203.0.113.1", path: str = "/api/ping"):
+    return client.get(path, headers={"X-Forwarded-For": ip})
+
+
+class TestRateLimit:
+    def test_allows_requests_under_limit(self):
+        client = make_client(max_requests=3, window_seconds=60)
+        assert all(hit(client).status_code == 200 for _ in range(3))
+
+    def test_rejects_over_limit(self):
+        client = make_client(max_requests=2, window_seconds=60)
+        hit(client)
+        hit(client)
+        res = hit(client)
+        assert res.status_code == 429
+        assert int(res.headers["retry-after"]) >= 1
+        assert res.json()["detail"]
+
+    def test_limits_are_per_ip(self):
+        client = make_client(max_requests=1, window_seconds=60)
+        assert hit(client, ip="203.0.113.1").status_code == 200
+        assert hit(client, ip="203.0.113.2").status_code == 200
+        assert hit(client, ip="203.0.113.1").status_code == 429
+
+    def test_window_slides(self, monkeypatch):
+        # Drive the middleware's coarse clock rather than patching
+        # time.monotonic, which the test client's event loop also reads
+        monkeypatch.setattr(rate_limit, "_coarse_now", 1000.0)
+        client = make_client(max_requests=2, window_seconds=60)
+        hit(client)
+        monkeypatch.setattr(rate_limit, "_coarse_now", 1030.0)
+        hit(client)
+        assert hit(client).status_code == 429
+        monkeypatch.setattr(rate_limit, "_coarse_now", 1061.0)   # first hit has left the window
+        assert hit(client).status_code == 200
+        assert hit(client).status_code == 429
+
+    def test_uses_coarse_clock_when_running(self, monkeypatch):
+        monkeypatch.setattr(rate_limit, "_coarse_now", 1000.0)
+        client = make_client(max_requests=1, window_seconds=60)
+        hit(client)
+        res = hit(client)
+        assert res.status_code == 429
+        assert res.headers["retry-after"] == "60"   # clock frozen at the first hit
+
+    def test_non_api_paths_not_limited(self):
+        client = make_client(max_requests=1, window_seconds=60)
+        assert all(hit(client, path="/static/ping").status_code == 200 for _ in range(3))
+
+    def test_tracked_ips_are_bounded(self):
+        client = make_client(max_requests=1, window_seconds=60, max_tracked_ips=2)
+        hit(client, ip="203.0.113.1")
+        hit(client, ip="203.0.113.2")
+        hit(client, ip="203.0.113.3")       # evicts .1, the least recently seen
+        assert hit(client, ip="203.0.113.1").status_code == 200
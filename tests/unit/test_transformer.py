@@ -3,8 +3,12 @@ Unit tests for TextTransformer.
 Run: pytest tests/unit/test_transformer.py -v
 """
 
+import re
+
 import pytest
-from core.transformer import TextTransformer
+from core.transformer import (
+    TextTransformer, _CONTRACTION_MAP, _FORMAL_TO_CASUAL, _PASSIVE_MAP, _literal_key, _run_rules,
+)
 
 
 @pytest.fixture
@@ -25,6 +29,13 @@ class TestContractions:
         result = transformer.transform("We cannot continue like this.")
         assert "can't" in result
 
+    def test_no_phrase_extends_another(self):
+        # The contraction and passive regexes are tries with no match priority;
+        # they are only exact while at most one phrase can match at a position.
+        for table in (_CONTRACTION_MAP, _PASSIVE_MAP):
+            phrases = list(table)
+            assert not [(a, b) for a in phrases for b in phrases if b.startswith(a + " ")]
+
     def test_contractions_disabled(self):
         t = TextTransformer(use_contractions=False, simplify_formal=False, vary_sentences=False)
         result = t.transform("We do not want to go.")
@@ -46,6 +57,29 @@ class TestFormalSimplification:
         result = transformer.transform("In conclusion, we have done well.")
         assert "In conclusion" not in result
 
+    def test_no_rule_shadowed_by_earlier(self):
+        # A phrase containing an earlier rule's whole phrase never matches:
+        # the earlier rule has already rewritten it.
+        phrases = [_literal_key(pattern) for pattern, _ in _FORMAL_TO_CASUAL]
+        phrases = [phrase for phrase in phrases if phrase]
+        shadowed = [
+            (a, b)
+            for i, b in enumerate(phrases)
+            for a in phrases[:i]
+            if a != b and re.search(rf"\b{re.escape(a)}\b", b)
+        ]
+        assert not shadowed
+
+    def test_replacement_feeds_later_rule(self):
+        # "in reality" is not in the input; the rule for it must still run
+        t = TextTransformer(use_contractions=False, vary_sentences=False)
+        assert t.transform("It works in practice.") == "It works actually."
+
+    def test_perspective_removed_with_its_space(self):
+        t = TextTransformer(use_contractions=False, vary_sentences=False)
+        result = t.transform("It was approved from a legal perspective!")
+        assert result == "It was approved!"
+
     def test_formal_simplification_disabled(self):
         t = TextTransformer(use_contractions=False, simplify_formal=False, vary_sentences=False)
         result = t.transform("Furthermore, this is important.")
@@ -78,4 +112,43 @@ class TestEdgeCases:
         t1 = TextTransformer(seed=1)
         t2 = TextTransformer(seed=1)
         text = "This is a test. " * 10
-        assert t1.transform(text) == t2.transform(text)
\ No newline at end of file
+        assert t1.transform(text) == t2.transform(text)
+
+    def test_transform_many_matches_transform(self):
+        t1 = TextTransformer(seed=1)
+        t2 = TextTransformer(seed=1)
+        texts = ["This is a test. " * 10, "", "   ", "We do not utilize it.", "It is fine."]
+        assert t1.transform_many(texts) == [t2.transform(text) for text in texts]
+
+    def test_options_are_read_only(self, transformer):
+        # Passes are resolved at construction; a later assignment would be ignored
+        with pytest.raises(AttributeError):
+            transformer.use_contractions = False
+        assert transformer.use_contractions
+
+
+class TestSentenceVariation:
+    def test_adds_openers_to_long_text(self, transformer):
+        text = "The plan works. " * 10
+        assert transformer.transform(text) != text.strip()
+
+    def test_keeps_line_breaks_between_sentences(self, transformer):
+        text = "First point.\nSecond point.\n\nThird point. Fourth point.\nThe fifth point. Sixth."
+        result = transformer.transform(text)
+        assert result.count("\n") == text.count("\n")
+
+
+class TestCaching:
+    def test_rule_passes_cached_across_instances(self):
+        text = "Furthermore, it is important to note that we do not agree."
+        first = TextTransformer(vary_sentences=False, cache=True).transform(text)
+        hits = _run_rules.cache_info().hits
+        assert TextTransformer(vary_sentences=False, cache=True).transform(text) == first
+        assert _run_rules.cache_info().hits == hits + 1
+
+    def test_cache_off_by_default(self):
+        text = "Furthermore, it is important to note that we do not agree."
+        expected = TextTransformer(vary_sentences=False, cache=True).transform(text)
+        info = _run_rules.cache_info()
+        assert TextTransformer(vary_sentences=False).transform(text) == expected
+        assert _run_rules.cache_info() == info